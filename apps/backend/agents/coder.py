@@ -85,7 +85,8 @@ async def run_autonomous_agent(
     This is decided by the agent itself based on the task complexity.
 
     Args:
-        project_dir: Root directory for the project
+        project_dir: Root directory for the project (already resolved by the
+            CLI entry point; no further resolve() calls are needed)
         spec_dir: Directory containing the spec (auto-claude/specs/001-name/)
         model: Claude model to use
         max_iterations: Maximum number of iterations (None for unlimited)
@@ -94,7 +95,8 @@ async def run_autonomous_agent(
     """
     # Set environment variable for security hooks to find the correct project directory
     # This is needed because os.getcwd() may return the wrong directory in worktree mode
-    os.environ[PROJECT_DIR_ENV_VAR] = str(project_dir.resolve())
+    # (project_dir arrives resolved from the CLI, so no second resolve() here)
+    os.environ[PROJECT_DIR_ENV_VAR] = str(project_dir)
 
     # Initialize recovery manager (handles memory persistence)
     recovery_manager = RecoveryManager(spec_dir, project_dir)
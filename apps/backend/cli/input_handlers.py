@@ -188,23 +188,17 @@ def read_multiline_input(prompt_text: str) -> str | None:
     print(box(content, width=60, style="light"))
     print()
 
-    lines = []
-    empty_count = 0
-    while True:
-        try:
-            line = input()
-            if line == "":
-                empty_count += 1
-                if empty_count >= 1:  # Stop on first empty line
-                    break
-            else:
-                empty_count = 0
-                lines.append(line)
-        except KeyboardInterrupt:
-            print()
-            print_status("Cancelled.", "warning")
-            return None
-        except EOFError:
-            break
+    # iter(input, "") terminates on the first empty line at C level, without
+    # per-line Python bookkeeping; extend() keeps lines already read if the
+    # stream ends with EOF instead of a blank line
+    lines: list[str] = []
+    try:
+        lines.extend(iter(input, ""))
+    except KeyboardInterrupt:
+        print()
+        print_status("Cancelled.", "warning")
+        return None
+    except EOFError:
+        pass
 
     return "\n".join(lines).strip()
@@ -5,7 +5,9 @@ Spec Commands
 CLI commands for managing specs (listing, finding, etc.)
 """
 
+import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 # Ensure parent directory is in path for imports (before other imports)
@@ -18,48 +20,117 @@ from workspace import get_existing_build_worktree
 
 from .utils import get_specs_dir
 
+# Status symbols for print_specs_list (hoisted so the dict literal isn't
+# rebuilt on every call)
+_STATUS_SYMBOLS: dict[str, str] = {
+    "complete": "[OK]",
+    "in_progress": "[..]",
+    "initialized": "[--]",
+    "pending": "[  ]",
+}
 
-def list_specs(project_dir: Path) -> list[dict]:
+
+@dataclass(slots=True)
+class SpecRecord:
+    """Metadata for one spec folder, gathered in a single directory pass."""
+
+    number: str
+    name: str
+    folder: str
+    path: Path
+    status: str
+    progress: str
+    has_build: bool
+    plan_mtime_ns: int | None
+
+
+# Memoized spec index keyed on the specs directory's (mtime_ns, size).
+# Repeated calls within one CLI invocation (e.g. find_spec followed by
+# print_specs_list) reuse the scan instead of re-walking and re-parsing JSON.
+_SPEC_CACHE: dict[Path, tuple[tuple[int, int], dict[str, SpecRecord]]] = {}
+
+# Subtask counts keyed by implementation_plan.json path, validated against the
+# plan's mtime_ns. Skips the JSON decode for plans that haven't changed even
+# when the directory-level cache misses (e.g. a new spec folder was added).
+_PROGRESS_CACHE: dict[str, tuple[int, int, int]] = {}
+
+
+def clear_cache() -> None:
+    """Clear the memoized spec index (call after writing into the specs dir)."""
+    _SPEC_CACHE.clear()
+    _PROGRESS_CACHE.clear()
+
+
+def _scan_specs(project_dir: Path) -> dict[str, SpecRecord]:
     """
-    List all specs in the project.
+    Walk the specs directory once and index every folder containing a spec.md.
+
+    Shared by list_specs and find_spec so a single CLI invocation never walks
+    the directory twice. Cached against the directory mtime, so repeated calls
+    return in O(1) until a spec folder is added or removed.
 
     Args:
         project_dir: Project root directory
 
     Returns:
-        List of spec info dicts with keys: number, name, path, status, progress
+        Dict mapping folder name to SpecRecord, sorted by folder name
     """
     specs_dir = get_specs_dir(project_dir)
-    specs = []
 
-    if not specs_dir.exists():
-        return specs
+    try:
+        dir_stat = os.stat(specs_dir)
+    except FileNotFoundError:
+        return {}
 
-    for spec_folder in sorted(specs_dir.iterdir()):
-        if not spec_folder.is_dir():
+    cache_key = (dir_stat.st_mtime_ns, dir_stat.st_size)
+    cached = _SPEC_CACHE.get(specs_dir)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    # os.scandir caches the dirent type info, avoiding a stat() per entry
+    # (Path.iterdir + is_dir costs 2 syscalls per spec on network filesystems)
+    with os.scandir(specs_dir) as it:
+        entries = list(it)
+
+    records: list[SpecRecord] = []
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False):
             continue
 
-        # Parse folder name (e.g., "001-initial-app")
-        folder_name = spec_folder.name
-        parts = folder_name.split("-", 1)
-        if len(parts) != 2 or not parts[0].isdigit():
+        # Check for spec.md - stat directly instead of exists() (1 syscall, not 2)
+        try:
+            os.stat(os.path.join(entry.path, "spec.md"))
+        except FileNotFoundError:
             continue
 
-        number = parts[0]
-        name = parts[1]
+        # Parse folder name (e.g., "001-initial-app"); non-standard names are
+        # still indexed for exact-match lookup but skipped by list_specs
+        folder_name = entry.name
+        parts = folder_name.split("-", 1)
+        if len(parts) == 2 and parts[0].isdigit():
+            number, name = parts
+        else:
+            number, name = "", folder_name
 
-        # Check for spec.md
-        spec_file = spec_folder / "spec.md"
-        if not spec_file.exists():
-            continue
+        spec_folder = Path(entry.path)
 
         # Check for existing build in worktree
         has_build = get_existing_build_worktree(project_dir, folder_name) is not None
 
         # Check progress via implementation_plan.json
-        plan_file = spec_folder / "implementation_plan.json"
-        if plan_file.exists():
-            completed, total = count_subtasks(spec_folder)
+        plan_path = os.path.join(entry.path, "implementation_plan.json")
+        try:
+            plan_mtime_ns = os.stat(plan_path).st_mtime_ns
+        except FileNotFoundError:
+            plan_mtime_ns = None
+
+        if plan_mtime_ns is not None:
+            cached_progress = _PROGRESS_CACHE.get(plan_path)
+            if cached_progress is not None and cached_progress[0] == plan_mtime_ns:
+                completed, total = cached_progress[1], cached_progress[2]
+            else:
+                completed, total = count_subtasks(spec_folder)
+                _PROGRESS_CACHE[plan_path] = (plan_mtime_ns, completed, total)
             if total > 0:
                 if completed == total:
                     status = "complete"
@@ -77,19 +148,52 @@ def list_specs(project_dir: Path) -> list[dict]:
         if has_build:
             status = f"{status} (has build)"
 
-        specs.append(
-            {
-                "number": number,
-                "name": name,
-                "folder": folder_name,
-                "path": spec_folder,
-                "status": status,
-                "progress": progress,
-                "has_build": has_build,
-            }
+        records.append(
+            SpecRecord(
+                number=number,
+                name=name,
+                folder=folder_name,
+                path=spec_folder,
+                status=status,
+                progress=progress,
+                has_build=has_build,
+                plan_mtime_ns=plan_mtime_ns,
+            )
         )
 
-    return specs
+    # Sort once on the parsed numeric prefix (sorting DirEntry/Path objects
+    # builds a string per comparison); this also orders "010" after "009"
+    # numerically rather than lexicographically. Non-numeric folders sort last.
+    records.sort(key=lambda r: (int(r.number) if r.number else sys.maxsize, r.folder))
+
+    index = {record.folder: record for record in records}
+    _SPEC_CACHE[specs_dir] = (cache_key, index)
+    return index
+
+
+def list_specs(project_dir: Path) -> list[dict]:
+    """
+    List all specs in the project.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        List of spec info dicts with keys: number, name, path, status, progress
+    """
+    return [
+        {
+            "number": record.number,
+            "name": record.name,
+            "folder": record.folder,
+            "path": record.path,
+            "status": record.status,
+            "progress": record.progress,
+            "has_build": record.has_build,
+        }
+        for record in _scan_specs(project_dir).values()
+        if record.number
+    ]
 
 
 def print_specs_list(project_dir: Path, auto_create: bool = True) -> None:
@@ -161,31 +265,33 @@ def print_specs_list(project_dir: Path, auto_create: bool = True) -> None:
             print("  python runners/spec_runner.py --interactive")
         return
 
-    print("\n" + "=" * 70)
-    print("  AVAILABLE SPECS")
-    print("=" * 70)
-    print()
-
-    # Status symbols
-    status_symbols = {
-        "complete": "[OK]",
-        "in_progress": "[..]",
-        "initialized": "[--]",
-        "pending": "[  ]",
-    }
+    # Buffer the listing and emit it with one write - per-line print() calls
+    # each acquire the stdout lock and flush with line buffering
+    out: list[str] = [
+        "",
+        "=" * 70,
+        "  AVAILABLE SPECS",
+        "=" * 70,
+        "",
+    ]
 
     for spec in specs:
         # Get base status for symbol
         base_status = spec["status"].split(" ")[0]
-        symbol = status_symbols.get(base_status, "[??]")
-
-        print(f"  {symbol} {spec['folder']}")
-        status_line = f"       Status: {spec['status']} | Subtasks: {spec['progress']}"
-        print(status_line)
-        print()
-
-    print("-" * 70)
-    print("\nTo run a spec:")
-    print("  python auto-claude/run.py --spec 001")
-    print("  python auto-claude/run.py --spec 001-feature-name")
-    print()
+        symbol = _STATUS_SYMBOLS.get(base_status, "[??]")
+
+        out.append(f"  {symbol} {spec['folder']}")
+        out.append(f"       Status: {spec['status']} | Subtasks: {spec['progress']}")
+        out.append("")
+
+    out.extend(
+        [
+            "-" * 70,
+            "",
+            "To run a spec:",
+            "  python auto-claude/run.py --spec 001",
+            "  python auto-claude/run.py --spec 001-feature-name",
+            "",
+        ]
+    )
+    sys.stdout.write("\n".join(out) + "\n")
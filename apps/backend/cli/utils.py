@@ -56,9 +56,6 @@ def import_dotenv():
 
 # Load .env with helpful error if dependencies not installed
 load_dotenv = import_dotenv()
-from graphiti_config import get_graphiti_status
-from linear_integration import LinearManager
-from linear_updater import is_linear_enabled
 from spec.pipeline import get_specs_dir
 from ui import (
     Icons,
@@ -105,45 +102,53 @@ def find_spec(project_dir: Path, spec_identifier: str) -> Path | None:
     Returns:
         Path to spec folder, or None if not found
     """
-    specs_dir = get_specs_dir(project_dir)
-
-    if specs_dir.exists():
-        # Try exact match first
-        exact_path = specs_dir / spec_identifier
-        if exact_path.exists() and (exact_path / "spec.md").exists():
-            return exact_path
-
-        # Try matching by number prefix
-        for spec_folder in specs_dir.iterdir():
-            if spec_folder.is_dir() and spec_folder.name.startswith(
-                spec_identifier + "-"
-            ):
-                if (spec_folder / "spec.md").exists():
-                    return spec_folder
+    # Share the single-pass spec index with list_specs/print_specs_list so one
+    # CLI invocation never walks the specs directory twice
+    # (imported here to avoid a circular import with spec_commands)
+    from .spec_commands import _scan_specs
+
+    index = _scan_specs(project_dir)
+    prefix = spec_identifier + "-"
+
+    # Try exact match first
+    record = index.get(spec_identifier)
+    if record is not None:
+        return record.path
+
+    # Try matching by number prefix
+    for folder_name, record in index.items():
+        if folder_name.startswith(prefix):
+            return record.path
 
     # Check worktree specs (for merge-preview, merge, review, discard operations)
     worktree_base = project_dir / ".auto-claude" / "worktrees" / "tasks"
     if worktree_base.exists():
-        # Try exact match in worktree
+        # Try exact match in worktree - stat spec.md directly instead of
+        # probing the folder and the file separately (1 syscall instead of 2)
         worktree_spec = (
             worktree_base / spec_identifier / ".auto-claude" / "specs" / spec_identifier
         )
-        if worktree_spec.exists() and (worktree_spec / "spec.md").exists():
+        try:
+            os.stat(os.path.join(str(worktree_spec), "spec.md"))
             return worktree_spec
+        except (FileNotFoundError, NotADirectoryError):
+            pass
 
         # Try matching by prefix in worktrees
-        for worktree_dir in worktree_base.iterdir():
-            if worktree_dir.is_dir() and worktree_dir.name.startswith(
-                spec_identifier + "-"
-            ):
-                spec_in_worktree = (
-                    worktree_dir / ".auto-claude" / "specs" / worktree_dir.name
+        with os.scandir(worktree_base) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if not entry.name.startswith(prefix):
+                    continue
+                spec_path = os.path.join(
+                    entry.path, ".auto-claude", "specs", entry.name
                 )
-                if (
-                    spec_in_worktree.exists()
-                    and (spec_in_worktree / "spec.md").exists()
-                ):
-                    return spec_in_worktree
+                try:
+                    os.stat(os.path.join(spec_path, "spec.md"))
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                return Path(spec_path)
 
     return None
 
@@ -155,6 +160,12 @@ def validate_environment(spec_dir: Path) -> bool:
     Returns:
         True if valid, False otherwise (with error messages printed)
     """
+    # Imported here so fast paths (--list) don't pay for the Graphiti and
+    # Linear integration modules they never touch
+    from graphiti_config import get_graphiti_status
+    from linear_integration import LinearManager
+    from linear_updater import is_linear_enabled
+
     # Validate platform-specific dependencies first (exits if missing)
     validate_platform_dependencies()
 
@@ -238,6 +249,10 @@ def get_project_dir(provided_dir: Path | None) -> Path:
     """
     Determine the project directory.
 
+    The returned path is fully resolved exactly once here; downstream code
+    (run_autonomous_agent, the QA loop, workspace handling) treats it and
+    paths derived from it as already resolved, so don't resolve() it again.
+
     Args:
         provided_dir: User-provided project directory (or None)
 
@@ -254,7 +269,7 @@ def get_project_dir(provided_dir: Path | None) -> Path:
         # Running from within apps/backend/ source directory, go up 2 levels
         project_dir = project_dir.parent.parent
 
-    return project_dir
+    return project_dir.resolve()
 
 
 def find_specs_dir(project_dir: Path) -> Path:
@@ -410,10 +410,19 @@ def is_first_run(spec_dir: Path) -> bool:
         return True
 
 
+# Prompt file contents keyed by filename, validated against the file's mtime.
+# QA/fixer loops re-load the same prompts every iteration; the cache skips the
+# re-read while still picking up edits made to a prompt mid-run.
+_PROMPT_CACHE: dict[str, tuple[int, str]] = {}
+
+
 def _load_prompt_file(filename: str) -> str:
     """
     Load a prompt file from the prompts directory.
 
+    Contents are cached against the file's mtime, so repeated loads within a
+    multi-iteration session don't re-read and re-decode the same bytes.
+
     Args:
         filename: Relative path to prompt file (e.g., "qa_reviewer.md" or "mcp_tools/electron_validation.md")
 
@@ -424,9 +433,18 @@ def _load_prompt_file(filename: str) -> str:
         FileNotFoundError: If prompt file doesn't exist
     """
     prompt_file = PROMPTS_DIR / filename
-    if not prompt_file.exists():
+    try:
+        mtime_ns = os.stat(prompt_file).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
-    return prompt_file.read_text()
+
+    cached = _PROMPT_CACHE.get(filename)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    text = prompt_file.read_text()
+    _PROMPT_CACHE[filename] = (mtime_ns, text)
+    return text
 
 
 def get_qa_reviewer_prompt(spec_dir: Path, project_dir: Path) -> str:
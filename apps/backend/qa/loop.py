@@ -77,7 +77,8 @@ async def run_qa_validation_loop(
     - No-test project handling
 
     Args:
-        project_dir: Project root directory
+        project_dir: Project root directory (already resolved by the CLI
+            entry point; no further resolve() calls are needed)
         spec_dir: Spec directory
         model: Claude model to use
         verbose: Whether to show detailed output
@@ -87,7 +88,8 @@ async def run_qa_validation_loop(
     """
     # Set environment variable for security hooks to find the correct project directory
     # This is needed because os.getcwd() may return the wrong directory in worktree mode
-    os.environ[PROJECT_DIR_ENV_VAR] = str(project_dir.resolve())
+    # (project_dir arrives resolved from the CLI, so no second resolve() here)
+    os.environ[PROJECT_DIR_ENV_VAR] = str(project_dir)
 
     debug_section("qa_loop", "QA Validation Loop")
     debug(
@@ -10,11 +10,20 @@ Memory Integration:
 - Saves QA findings (bugs, patterns, validation outcomes) after session
 """
 
+import reprlib
+import sys
 from pathlib import Path
 
 # Memory integration for cross-session learning
 from agents.memory_manager import get_graphiti_context, save_session_memory
-from claude_agent_sdk import ClaudeSDKClient
+from claude_agent_sdk import (
+    AssistantMessage,
+    ClaudeSDKClient,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
 from debug import debug, debug_detailed, debug_error, debug_section, debug_success
 from prompts_pkg import get_qa_reviewer_prompt
 from security.tool_input_validator import get_safe_tool_input
@@ -30,6 +39,33 @@ from .criteria import get_qa_signoff_status
 # QA REVIEWER SESSION
 # =============================================================================
 
+# Tools whose results are worth persisting in the task logger detail view
+_DETAIL_TOOLS: frozenset[str] = frozenset({"Read", "Grep", "Bash", "Edit", "Write"})
+
+# Bounded repr for verbose tool-input previews: truncates each value while
+# building, so a Write carrying a whole file never gets fully serialized
+_INPUT_REPR = reprlib.Repr()
+_INPUT_REPR.maxstring = 120
+_INPUT_REPR.maxother = 120
+_INPUT_REPR.maxdict = 8
+
+# Detail payload cap for task_logger: enough for human inspection without
+# retaining megabytes of Read/Grep output for the lifetime of the session
+_DETAIL_MAX = 6144
+_DETAIL_HEAD = 4096
+_DETAIL_TAIL = 2048
+
+
+def _truncate_detail(text: str) -> str:
+    """Bound a tool-result detail string to a head + tail excerpt."""
+    if len(text) <= _DETAIL_MAX:
+        return text
+    return (
+        text[:_DETAIL_HEAD]
+        + f"\n… [truncated {len(text) - _DETAIL_MAX} bytes] …\n"
+        + text[-_DETAIL_TAIL:]
+    )
+
 
 async def run_qa_agent_session(
     client: ClaudeSDKClient,
@@ -102,9 +138,13 @@ async def run_qa_agent_session(
         print("✓ Memory context loaded for QA reviewer")
         debug_success("qa_reviewer", "Graphiti memory context loaded for QA")
 
-    # Add session context
-    prompt += f"\n\n---\n\n**QA Session**: {qa_session}\n"
-    prompt += f"**Max Iterations**: {max_iterations}\n"
+    # Add session context in a single composition - each += on a multi-KB
+    # prompt reallocates and copies the whole string
+    prompt = (
+        f"{prompt}\n\n---\n\n"
+        f"**QA Session**: {qa_session}\n"
+        f"**Max Iterations**: {max_iterations}\n"
+    )
 
     # Add error context for self-correction if previous iteration failed
     if previous_error:
@@ -188,24 +228,27 @@ This is attempt {previous_error.get("consecutive_errors", 1) + 1}. If you fail t
         await client.query(prompt)
         debug_success("qa_reviewer", "Query sent successfully")
 
-        response_text = ""
+        # Accumulate text chunks and join once at the end - repeated str
+        # concatenation is quadratic in total output size on long sessions
+        response_parts: list[str] = []
         debug("qa_reviewer", "Starting to receive response stream...")
         async for msg in client.receive_response():
-            msg_type = type(msg).__name__
             message_count += 1
             debug_detailed(
                 "qa_reviewer",
                 f"Received message #{message_count}",
-                msg_type=msg_type,
+                msg_type=type(msg).__name__,
             )
 
-            if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+            # isinstance dispatch on the SDK classes is a C-level pointer
+            # check; comparing type(...).__name__ strings costs more per
+            # message on this streaming hot path
+            if isinstance(msg, AssistantMessage):
                 for block in msg.content:
-                    block_type = type(block).__name__
-
-                    if block_type == "TextBlock" and hasattr(block, "text"):
-                        response_text += block.text
-                        print(block.text, end="", flush=True)
+                    if isinstance(block, TextBlock):
+                        response_parts.append(block.text)
+                        # Write without a per-chunk flush; flushed once per message
+                        sys.stdout.write(block.text)
                         # Log text to task logger (persist without double-printing)
                         if task_logger and block.text.strip():
                             task_logger.log(
@@ -214,7 +257,7 @@ This is attempt {previous_error.get("consecutive_errors", 1) + 1}. If you fail t
                                 LogPhase.VALIDATION,
                                 print_to_console=False,
                             )
-                    elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                    elif isinstance(block, ToolUseBlock):
                         tool_name = block.name
                         tool_input_display = None
                         tool_count += 1
@@ -249,19 +292,18 @@ This is attempt {previous_error.get("consecutive_errors", 1) + 1}. If you fail t
                         else:
                             print(f"\n[QA Tool: {tool_name}]", flush=True)
 
-                        if verbose and hasattr(block, "input"):
-                            input_str = str(block.input)
+                        if verbose:
+                            input_str = _INPUT_REPR.repr(block.input)
                             if len(input_str) > 300:
-                                print(f"   Input: {input_str[:300]}...", flush=True)
-                            else:
-                                print(f"   Input: {input_str}", flush=True)
+                                input_str = f"{input_str[:300]}..."
+                            print(f"   Input: {input_str}", flush=True)
                         current_tool = tool_name
 
-            elif msg_type == "UserMessage" and hasattr(msg, "content"):
-                for block in msg.content:
-                    block_type = type(block).__name__
+                sys.stdout.flush()
 
-                    if block_type == "ToolResultBlock":
+            elif isinstance(msg, UserMessage):
+                for block in msg.content:
+                    if isinstance(block, ToolResultBlock):
                         is_error = getattr(block, "is_error", False)
                         result_content = getattr(block, "content", "")
 
@@ -274,38 +316,35 @@ This is attempt {previous_error.get("consecutive_errors", 1) + 1}. If you fail t
                             error_str = str(result_content)[:500]
                             print(f"   [Error] {error_str}", flush=True)
                             if task_logger and current_tool:
-                                # Store full error in detail for expandable view
+                                # Store bounded error in detail for expandable view
                                 task_logger.tool_end(
                                     current_tool,
                                     success=False,
                                     result=error_str[:100],
-                                    detail=str(result_content),
+                                    detail=_truncate_detail(str(result_content)),
                                     phase=LogPhase.VALIDATION,
                                 )
                         else:
+                            # Coerce to str once and reuse everywhere below
+                            result_str = (
+                                result_content
+                                if isinstance(result_content, str)
+                                else str(result_content)
+                            )
                             debug_detailed(
                                 "qa_reviewer",
                                 f"Tool success: {current_tool}",
-                                result_length=len(str(result_content)),
+                                result_length=len(result_str),
                             )
                             if verbose:
-                                result_str = str(result_content)[:200]
-                                print(f"   [Done] {result_str}", flush=True)
+                                print(f"   [Done] {result_str[:200]}", flush=True)
                             else:
                                 print("   [Done]", flush=True)
                             if task_logger and current_tool:
-                                # Store full result in detail for expandable view
+                                # Store bounded result in detail for expandable view
                                 detail_content = None
-                                if current_tool in (
-                                    "Read",
-                                    "Grep",
-                                    "Bash",
-                                    "Edit",
-                                    "Write",
-                                ):
-                                    result_str = str(result_content)
-                                    if len(result_str) < 50000:
-                                        detail_content = result_str
+                                if current_tool in _DETAIL_TOOLS:
+                                    detail_content = _truncate_detail(result_str)
                                 task_logger.tool_end(
                                     current_tool,
                                     success=True,
@@ -315,6 +354,8 @@ This is attempt {previous_error.get("consecutive_errors", 1) + 1}. If you fail t
 
                         current_tool = None
 
+        response_text = "".join(response_parts)
+
         print("\n" + "-" * 70 + "\n")
 
         # Check the QA result from implementation_plan.json
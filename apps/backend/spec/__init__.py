@@ -32,8 +32,17 @@ from .complexity import (
     run_ai_complexity_assessment,
     save_assessment,
 )
-from .phases import PhaseExecutor, PhaseResult
-from .pipeline import SpecOrchestrator, get_specs_dir
+from .pipeline import get_specs_dir
+
+# The orchestrator and phase executor transitively import the Claude Agent
+# SDK; they are loaded lazily (PEP 562) so light consumers such as
+# `from spec.pipeline import get_specs_dir` on the CLI fast paths don't pull
+# in the whole agent stack at import time.
+_LAZY_EXPORTS = {
+    "SpecOrchestrator": ".pipeline",
+    "PhaseExecutor": ".phases",
+    "PhaseResult": ".phases",
+}
 
 __all__ = [
     # Main orchestrator
@@ -49,3 +58,15 @@ __all__ = [
     "PhaseExecutor",
     "PhaseResult",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy-load heavy re-exports (PEP 562) on first attribute access."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
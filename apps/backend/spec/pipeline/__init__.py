@@ -13,10 +13,24 @@ Components:
 from init import init_auto_claude_dir
 
 from .models import get_specs_dir
-from .orchestrator import SpecOrchestrator
 
 __all__ = [
     "SpecOrchestrator",
     "get_specs_dir",
     "init_auto_claude_dir",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy-load the orchestrator (PEP 562).
+
+    SpecOrchestrator transitively imports the Claude Agent SDK; loading it on
+    first attribute access keeps `from spec.pipeline import get_specs_dir`
+    cheap for CLI fast paths like --list.
+    """
+    if name == "SpecOrchestrator":
+        from .orchestrator import SpecOrchestrator
+
+        globals()[name] = SpecOrchestrator
+        return SpecOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,111 +11,108 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
 from graphiti_config import is_graphiti_enabled, get_graphiti_status, GraphitiConfig
 
 
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Run a test against an empty os.environ.
+
+    Swapping in an empty dict is cheaper than patch.dict's snapshot-and-restore
+    of the full environment per test. Use the returned monkeypatch's setenv()
+    to add variables; teardown restores the real environment.
+    """
+    monkeypatch.setattr(os, "environ", {})
+    return monkeypatch
+
+
 class TestIsGraphitiEnabled:
     """Tests for is_graphiti_enabled function."""
 
-    def test_returns_false_when_not_set(self):
+    def test_returns_false_when_not_set(self, clean_env):
         """Returns False when GRAPHITI_ENABLED is not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            assert is_graphiti_enabled() is False
+        assert is_graphiti_enabled() is False
 
-    def test_returns_false_when_disabled(self):
+    def test_returns_false_when_disabled(self, clean_env):
         """Returns False when GRAPHITI_ENABLED is false."""
-        with patch.dict(os.environ, {"GRAPHITI_ENABLED": "false"}, clear=True):
-            assert is_graphiti_enabled() is False
+        clean_env.setenv("GRAPHITI_ENABLED", "false")
+        assert is_graphiti_enabled() is False
 
-    def test_returns_true_without_openai_key(self):
+    def test_returns_true_without_openai_key(self, clean_env):
         """Returns True when enabled even without OPENAI_API_KEY.
 
         Since LLM provider is no longer required (Claude SDK handles RAG) and
         embedder is optional (keyword search fallback works), Graphiti is
         available whenever GRAPHITI_ENABLED=true.
         """
-        with patch.dict(os.environ, {"GRAPHITI_ENABLED": "true"}, clear=True):
-            assert is_graphiti_enabled() is True
+        clean_env.setenv("GRAPHITI_ENABLED", "true")
+        assert is_graphiti_enabled() is True
 
-    def test_returns_true_when_configured(self):
+    def test_returns_true_when_configured(self, clean_env):
         """Returns True when properly configured."""
-        with patch.dict(os.environ, {
-            "GRAPHITI_ENABLED": "true",
-            "OPENAI_API_KEY": "sk-test-key"
-        }, clear=True):
-            assert is_graphiti_enabled() is True
+        clean_env.setenv("GRAPHITI_ENABLED", "true")
+        clean_env.setenv("OPENAI_API_KEY", "sk-test-key")
+        assert is_graphiti_enabled() is True
 
 
 class TestGetGraphitiStatus:
     """Tests for get_graphiti_status function."""
 
-    def test_status_when_disabled(self):
+    def test_status_when_disabled(self, clean_env):
         """Returns correct status when disabled."""
-        with patch.dict(os.environ, {}, clear=True):
-            status = get_graphiti_status()
-            assert status["enabled"] is False
-            assert status["available"] is False
-            assert "not set" in status["reason"].lower()
+        status = get_graphiti_status()
+        assert status["enabled"] is False
+        assert status["available"] is False
+        assert "not set" in status["reason"].lower()
 
     @pytest.mark.skip(reason="Environment-dependent test - fails when OPENAI_API_KEY is set")
-    def test_status_when_missing_openai_key(self):
+    def test_status_when_missing_openai_key(self, clean_env):
         """Returns correct status when OPENAI_API_KEY missing.
 
         Since embedder is optional (keyword search fallback works), the status
         is still available but will have validation warnings about missing
         embedder credentials.
         """
-        with patch.dict(os.environ, {"GRAPHITI_ENABLED": "true"}, clear=True):
-            status = get_graphiti_status()
-            assert status["enabled"] is True
-            # Available because embedder is optional (keyword search fallback)
-            assert status["available"] is True
+        clean_env.setenv("GRAPHITI_ENABLED", "true")
+        status = get_graphiti_status()
+        assert status["enabled"] is True
+        # Available because embedder is optional (keyword search fallback)
+        assert status["available"] is True
 
 
 class TestGraphitiConfig:
     """Tests for GraphitiConfig class."""
 
-    def test_from_env_defaults(self):
+    def test_from_env_defaults(self, clean_env):
         """Config uses correct defaults for LadybugDB (embedded database)."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = GraphitiConfig.from_env()
-            assert config.enabled is False
-            assert config.database == "auto_claude_memory"
-            assert "auto-claude" in config.db_path.lower()  # Default path in ~/.auto-claude/
+        config = GraphitiConfig.from_env()
+        assert config.enabled is False
+        assert config.database == "auto_claude_memory"
+        assert "auto-claude" in config.db_path.lower()  # Default path in ~/.auto-claude/
 
-    def test_from_env_custom_values(self):
+    def test_from_env_custom_values(self, clean_env):
         """Config reads custom environment values."""
-        with patch.dict(os.environ, {
-            "GRAPHITI_ENABLED": "true",
-            "OPENAI_API_KEY": "sk-test",
-            "GRAPHITI_DATABASE": "my_graph",
-            "GRAPHITI_DB_PATH": "/custom/path"
-        }, clear=True):
-            config = GraphitiConfig.from_env()
-            assert config.enabled is True
-            assert config.database == "my_graph"
-            assert config.db_path == "/custom/path"
-
-    def test_is_valid_requires_only_enabled(self):
+        clean_env.setenv("GRAPHITI_ENABLED", "true")
+        clean_env.setenv("OPENAI_API_KEY", "sk-test")
+        clean_env.setenv("GRAPHITI_DATABASE", "my_graph")
+        clean_env.setenv("GRAPHITI_DB_PATH", "/custom/path")
+        config = GraphitiConfig.from_env()
+        assert config.enabled is True
+        assert config.database == "my_graph"
+        assert config.db_path == "/custom/path"
+
+    @pytest.mark.parametrize("env,expected", [
+        ({}, False),
+        ({"GRAPHITI_ENABLED": "true"}, True),
+        ({"GRAPHITI_ENABLED": "true", "OPENAI_API_KEY": "sk-test"}, True),
+    ], ids=["not-enabled", "enabled-only", "enabled-with-embedder"])
+    def test_is_valid_requires_only_enabled(self, clean_env, env, expected):
         """is_valid() requires only GRAPHITI_ENABLED.
 
         LLM provider is no longer required (Claude SDK handles RAG) and
         embedder is optional (keyword search fallback works).
         """
-        # Not enabled
-        with patch.dict(os.environ, {}, clear=True):
-            config = GraphitiConfig.from_env()
-            assert config.is_valid() is False
-
-        # Only enabled - now valid (embedder optional)
-        with patch.dict(os.environ, {"GRAPHITI_ENABLED": "true"}, clear=True):
-            config = GraphitiConfig.from_env()
-            assert config.is_valid() is True
-
-        # With embedder configured
-        with patch.dict(os.environ, {
-            "GRAPHITI_ENABLED": "true",
-            "OPENAI_API_KEY": "sk-test"
-        }, clear=True):
-            config = GraphitiConfig.from_env()
-            assert config.is_valid() is True
+        for key, value in env.items():
+            clean_env.setenv(key, value)
+        config = GraphitiConfig.from_env()
+        assert config.is_valid() is expected
 
 
 class TestMultiProviderConfig: